@@ -2,6 +2,7 @@ import math
 import tkinter as tk
 from tkinter import messagebox
 
+from quadrocopter.model.cache import PathCache
 from quadrocopter.model.path_finder import PathFinder
 from quadrocopter.model.utils import Transmitter, Point
 
@@ -31,6 +32,7 @@ class QuadrocopterApp:
         self.end = None
 
         self.path = None
+        self.path_cache = PathCache()
 
         self.setting_start = False
         self.setting_end = False
@@ -159,6 +161,7 @@ class QuadrocopterApp:
         self.start = None
         self.end = None
         self.path = None
+        self.path_cache.clear()
         self.result_box.config(state=tk.NORMAL, bg='white')
         self.result_box.delete(1.0, tk.END)
         self.result_box.config(state=tk.DISABLED)
@@ -191,7 +194,8 @@ class QuadrocopterApp:
             messagebox.showerror("Error", "Please set start point, end point, and add transmitters.")
             return
 
-        path_finder = PathFinder(start=self.start, end=self.end, transmitters=self.transmitters)
+        path_finder = PathFinder(start=self.start, end=self.end, transmitters=self.transmitters,
+                                 cache=self.path_cache)
         result, self.path = path_finder.is_path_possible()
         bg_color = "lightgreen" if result else "red"
 
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from typing import FrozenSet, List, Optional, Tuple
+
+from quadrocopter.model.utils import Point, Transmitter
+
+FINGERPRINT_MASK = (1 << 64) - 1
+
+CoverKey = Tuple[FrozenSet[Tuple[int, int, int]], FrozenSet[Tuple[int, int, int]]]
+
+
+class PathCache:
+    """
+    An in-memory LRU/TTL cache for path finding results.
+
+    Results are keyed by the transmitters covering the start and end points, so a query whose endpoints
+    are covered by the same transmitters as a previous one reuses its result. Every query fingerprints
+    the given transmitter set while looking for the covering transmitters. When the fingerprint differs
+    from the one of the previous query (a transmitter was added, removed or resized), all stored
+    results are invalidated automatically.
+
+    Attributes:
+        maxsize (int): The maximum number of stored results.
+        ttl (Optional[float]): The lifetime of a result in seconds, None means results never expire.
+        hits (int): The number of queries answered from the cache.
+        misses (int): The number of queries not answered from the cache.
+    """
+
+    def __init__(self, maxsize: int = 128, ttl: Optional[float] = None) -> None:
+        """
+        Initialize a PathCache object.
+
+        Args:
+            maxsize (int): The maximum number of stored results.
+            ttl (Optional[float]): The lifetime of a result in seconds, None means results never expire.
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be a positive number.")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be a positive number.")
+
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+
+        self._fingerprint = 0
+        self._entries: OrderedDict[CoverKey, Tuple[Tuple[bool, List[Transmitter]], Optional[float]]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def fingerprint(self) -> int:
+        """
+        Get the fingerprint of the transmitter set of the last query.
+
+        Returns:
+            int: The fingerprint, independent of the order of transmitters.
+        """
+        return self._fingerprint
+
+    def invalidate(self) -> None:
+        """
+        Remove all stored results, keeping the fingerprint and the hit/miss counters.
+        """
+        self._entries.clear()
+
+    def clear(self) -> None:
+        """
+        Reset the cache to its initial state, including the fingerprint and the hit/miss counters.
+        """
+        self._fingerprint = 0
+        self.hits = 0
+        self.misses = 0
+        self.invalidate()
+
+    def get(self, start: Point, end: Point,
+            transmitters: List[Transmitter]) -> Optional[Tuple[bool, List[Transmitter]]]:
+        """
+        Look up the result of a query.
+
+        Args:
+            start (Point): The starting point of the path.
+            end (Point): The ending point of the path.
+            transmitters (List[Transmitter]): The transmitters in the environment.
+
+        Returns:
+            Optional[Tuple[bool, List[Transmitter]]]: The cached result or None if it is not found.
+        """
+        key = self._cover_key(start, end, transmitters)
+        entry = self._entries.get(key)
+
+        if entry is not None and entry[1] is not None and entry[1] <= time.monotonic():
+            del self._entries[key]
+            entry = None
+
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        result = entry[0]
+        return result[0], list(result[1])
+
+    def put(self, start: Point, end: Point, transmitters: List[Transmitter],
+            result: Tuple[bool, List[Transmitter]]) -> None:
+        """
+        Store the result of a query.
+
+        Args:
+            start (Point): The starting point of the path.
+            end (Point): The ending point of the path.
+            transmitters (List[Transmitter]): The transmitters in the environment.
+            result (Tuple[bool, List[Transmitter]]): The result returned by the path finder.
+        """
+        key = self._cover_key(start, end, transmitters)
+        expires_at = None if self.ttl is None else time.monotonic() + self.ttl
+        self._entries[key] = ((result[0], list(result[1])), expires_at)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def _cover_key(self, start: Point, end: Point, transmitters: List[Transmitter]) -> CoverKey:
+        fingerprint = 0
+        start_cover, end_cover = [], []
+
+        for transmitter in transmitters:
+            description = transmitter.center.x, transmitter.center.y, transmitter.power
+            fingerprint += hash(description) & FINGERPRINT_MASK
+            if transmitter.is_point_in_range(start):
+                start_cover.append(description)
+            if transmitter.is_point_in_range(end):
+                end_cover.append(description)
+
+        fingerprint &= FINGERPRINT_MASK
+        if fingerprint != self._fingerprint:
+            self._fingerprint = fingerprint
+            self.invalidate()
+
+        return frozenset(start_cover), frozenset(end_cover)
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 from collections import deque
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 from matplotlib import pyplot as plt
 
+from quadrocopter.model.cache import PathCache
 from quadrocopter.model.utils import Point, Transmitter
 
 
@@ -16,9 +17,11 @@ class PathFinder:
         start (Point): The starting point of the path.
         end (Point): The ending point of the path.
         transmitters (List[Transmitter]): A list of transmitters in the environment.
+        cache (Optional[PathCache]): A cache of results.
     """
 
-    def __init__(self, start: Point, end: Point, transmitters: List[Transmitter]) -> None:
+    def __init__(self, start: Point, end: Point, transmitters: List[Transmitter],
+                 cache: Optional[PathCache] = None) -> None:
         """
         Initialize a PathFinder object.
 
@@ -26,10 +29,12 @@ class PathFinder:
             start (Point): The starting point of the path.
             end (Point): The ending point of the path.
             transmitters (List[Transmitter]): A list of transmitters in the environment.
+            cache (Optional[PathCache]): A cache of results (optional).
         """
         self.start = start
         self.end = end
         self.transmitters = transmitters
+        self.cache = cache
 
     def is_path_possible(self) -> Tuple[bool, List[Transmitter]]:
         """
@@ -40,6 +45,17 @@ class PathFinder:
             if a path is possible, and the second element is a list of transmitters representing
             the path if found.
         """
+        if self.cache is None:
+            return self._find_path()
+
+        result = self.cache.get(self.start, self.end, self.transmitters)
+        if result is None:
+            result = self._find_path()
+            self.cache.put(self.start, self.end, self.transmitters, result)
+
+        return result
+
+    def _find_path(self) -> Tuple[bool, List[Transmitter]]:
         visited = set()
         queue = deque(
             [(transmitter,) for transmitter in self.transmitters if transmitter.is_point_in_range(self.start)])
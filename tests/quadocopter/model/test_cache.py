@@ -0,0 +1,113 @@
+import unittest
+from unittest import mock
+
+from quadrocopter.model.cache import PathCache
+from quadrocopter.model.utils import Transmitter, Point
+
+
+class TestPathCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self.transmitters = [
+            Transmitter(Point(2, 2), 2),
+            Transmitter(Point(6, 2), 2),
+            Transmitter(Point(10, 2), 2)
+        ]
+        self.cache = PathCache(maxsize=4)
+        self.result = (True, self.transmitters[:2])
+
+    def test_get_missing(self) -> None:
+        self.assertIsNone(self.cache.get(Point(1, 1), Point(6, 3), self.transmitters))
+        self.assertEqual(self.cache.hits, 0)
+        self.assertEqual(self.cache.misses, 1)
+
+    def test_get_stored(self) -> None:
+        self.cache.put(Point(1, 1), Point(6, 3), self.transmitters, self.result)
+        self.assertEqual(self.cache.get(Point(1, 1), Point(6, 3), self.transmitters), self.result)
+        self.assertEqual(self.cache.hits, 1)
+        self.assertEqual(self.cache.misses, 0)
+
+    def test_get_returns_copy(self) -> None:
+        self.cache.put(Point(1, 1), Point(6, 3), self.transmitters, self.result)
+        self.cache.get(Point(1, 1), Point(6, 3), self.transmitters)[1].clear()
+        self.assertEqual(self.cache.get(Point(1, 1), Point(6, 3), self.transmitters), self.result)
+
+    def test_get_same_covering_transmitters(self) -> None:
+        self.cache.put(Point(1, 1), Point(6, 3), self.transmitters, self.result)
+        self.assertEqual(self.cache.get(Point(1, 2), Point(7, 2), self.transmitters), self.result)
+        self.assertIsNone(self.cache.get(Point(1, 2), Point(10, 2), self.transmitters))
+
+    def test_fingerprint_order_independent(self) -> None:
+        other = PathCache()
+        self.cache.get(Point(1, 1), Point(6, 3), self.transmitters)
+        other.get(Point(1, 1), Point(6, 3), list(reversed(self.transmitters)))
+        self.assertEqual(self.cache.fingerprint, other.fingerprint)
+
+    def test_add_transmitter_invalidates(self) -> None:
+        self.cache.put(Point(1, 1), Point(6, 3), self.transmitters, self.result)
+        self.transmitters.append(Transmitter(Point(14, 2), 2))
+        self.assertIsNone(self.cache.get(Point(1, 1), Point(6, 3), self.transmitters))
+        self.assertEqual(len(self.cache), 0)
+
+    def test_remove_transmitter_invalidates(self) -> None:
+        self.cache.put(Point(1, 1), Point(6, 3), self.transmitters, self.result)
+        self.transmitters.pop()
+        self.assertIsNone(self.cache.get(Point(1, 1), Point(6, 3), self.transmitters))
+        self.assertEqual(len(self.cache), 0)
+
+    def test_resize_transmitter_invalidates(self) -> None:
+        self.cache.put(Point(1, 1), Point(6, 3), self.transmitters, self.result)
+        self.transmitters[1].power = 1
+        self.assertIsNone(self.cache.get(Point(1, 1), Point(6, 3), self.transmitters))
+        self.assertEqual(len(self.cache), 0)
+
+    def test_get_other_transmitters(self) -> None:
+        self.cache.put(Point(1, 1), Point(6, 3), self.transmitters, self.result)
+        self.assertIsNone(self.cache.get(Point(1, 1), Point(6, 3), []))
+        self.assertIsNone(self.cache.get(Point(1, 1), Point(6, 3), self.transmitters))
+        self.assertEqual(self.cache.misses, 2)
+
+    def test_put_after_change(self) -> None:
+        self.cache.put(Point(1, 1), Point(6, 3), self.transmitters, self.result)
+        self.cache.put(Point(1, 1), Point(6, 3), [], (False, []))
+        self.assertEqual(len(self.cache), 1)
+        self.assertEqual(self.cache.get(Point(1, 1), Point(6, 3), []), (False, []))
+
+    def test_lru_eviction(self) -> None:
+        cache = PathCache(maxsize=2)
+
+        cache.put(Point(1, 1), Point(6, 3), self.transmitters, self.result)
+        cache.put(Point(1, 2), Point(9, 2), self.transmitters, (True, self.transmitters))
+        cache.get(Point(1, 1), Point(6, 3), self.transmitters)
+        cache.put(Point(20, 20), Point(6, 3), self.transmitters, (False, []))
+
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get(Point(1, 2), Point(9, 2), self.transmitters))
+        self.assertEqual(cache.get(Point(1, 1), Point(6, 3), self.transmitters), self.result)
+
+    def test_ttl_expiration(self) -> None:
+        cache = PathCache(ttl=10)
+
+        with mock.patch('quadrocopter.model.cache.time.monotonic', return_value=100):
+            cache.put(Point(1, 1), Point(6, 3), self.transmitters, self.result)
+
+        with mock.patch('quadrocopter.model.cache.time.monotonic', return_value=105):
+            self.assertEqual(cache.get(Point(1, 1), Point(6, 3), self.transmitters), self.result)
+
+        with mock.patch('quadrocopter.model.cache.time.monotonic', return_value=110):
+            self.assertIsNone(cache.get(Point(1, 1), Point(6, 3), self.transmitters))
+
+    def test_clear(self) -> None:
+        self.cache.put(Point(1, 1), Point(6, 3), self.transmitters, self.result)
+        self.cache.get(Point(1, 1), Point(6, 3), self.transmitters)
+        self.cache.clear()
+
+        self.assertEqual(len(self.cache), 0)
+        self.assertEqual(self.cache.fingerprint, 0)
+        self.assertEqual(self.cache.hits, 0)
+        self.assertEqual(self.cache.misses, 0)
+
+    def test_invalid_arguments(self) -> None:
+        with self.assertRaises(ValueError):
+            PathCache(maxsize=0)
+        with self.assertRaises(ValueError):
+            PathCache(ttl=0)
@@ -1,5 +1,6 @@
 import unittest
 
+from quadrocopter.model.cache import PathCache
 from quadrocopter.model.path_finder import PathFinder
 from quadrocopter.model.utils import Transmitter, Point
 
@@ -51,3 +52,26 @@ class TestPathFinder(unittest.TestCase):
         pf = PathFinder(start, end, self.circular_transmitters)
         possible, _ = pf.is_path_possible()
         self.assertFalse(possible)
+
+    def test_is_path_possible_cached(self) -> None:
+        cache = PathCache()
+        start = Point(10, 19)
+        end = Point(19, 14)
+
+        expected = PathFinder(start, end, self.transmitters).is_path_possible()
+        self.assertEqual(PathFinder(start, end, self.transmitters, cache).is_path_possible(), expected)
+        self.assertEqual(PathFinder(start, end, self.transmitters, cache).is_path_possible(), expected)
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(cache.misses, 1)
+
+    def test_is_path_possible_cached_after_change(self) -> None:
+        cache = PathCache()
+        start = Point(10, 19)
+        end = Point(19, 14)
+
+        PathFinder(start, end, self.transmitters, cache).is_path_possible()
+        self.transmitters[3].power = 1
+        possible, _ = PathFinder(start, end, self.transmitters, cache).is_path_possible()
+        self.assertFalse(possible)
+        self.assertEqual(cache.hits, 0)
+        self.assertEqual(cache.misses, 2)